@@ -1,8 +1,15 @@
 """PDF object tree parser with lazy loading support."""
 
 import logging
+import mmap
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 import pypdf
 from pypdf.generic import (
@@ -17,6 +24,7 @@ from pypdf.generic import (
     NumberObject,
     StreamObject,
     TextStringObject,
+    read_object,
 )
 
 from .exceptions import InvalidObjectIDError, InvalidPathError, ObjectNotFoundError, PDFParsingError
@@ -31,6 +39,70 @@ from .types import (
 
 logger = logging.getLogger(__name__)
 
+# Object IDs arrive as '1 0' (and '1-0' is tolerated); validated in one step
+_OBJECT_ID_RE = re.compile(r"^\s*(\d+)[\s-](\d+)\s*$")
+
+
+@lru_cache(maxsize=4096)
+def _parse_object_id(object_id: str) -> tuple[int, int]:
+    """Parse an object ID like '1 0' into (objnum, gennum).
+
+    Cached because MCP clients tend to re-request the same handful of IDs.
+
+    Raises:
+        InvalidObjectIDError: If the ID does not match the expected format
+    """
+    match = _OBJECT_ID_RE.match(object_id)
+    if match is None:
+        raise InvalidObjectIDError(f"Invalid object ID format: {object_id}. Expected format: '1 0'")
+    return int(match.group(1)), int(match.group(2))
+
+
+@lru_cache(maxsize=8)
+def _open_reader(path: str, mtime_ns: int, size: int) -> pypdf.PdfReader:
+    """Open a ``PdfReader`` for *path*, cached on (path, mtime_ns, size).
+
+    Constructing a reader reparses the xref table and object stream headers,
+    and MCP clients typically issue many tool calls against the same file.
+    The mtime/size key invalidates stale entries automatically. The file is
+    memory-mapped (mmap objects are file-like) so pypdf's seeks and reads
+    become pointer arithmetic over the page cache instead of copying the
+    whole file into a bytes object; the descriptor is closed right away
+    since the mapping outlives it.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        try:
+            stream: Any = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # mmap rejects empty/special files; fall back to an in-memory copy
+            stream = BytesIO(Path(path).read_bytes())
+    finally:
+        os.close(fd)
+
+    reader = pypdf.PdfReader(stream)
+    # Cached readers are shared across worker threads, but pypdf readers are
+    # not thread-safe (shared stream position and resolution cache), so each
+    # carries a lock that callers hold for the duration of a parse
+    reader._pdf_mcp_lock = threading.Lock()
+    return reader
+
+
+def _reader_for(source: str | Path | BinaryIO) -> pypdf.PdfReader:
+    """Return a ``PdfReader`` for *source*: a filesystem path or a binary stream.
+
+    Streams are rewound and handed to pypdf directly (the caller owns their
+    lifetime); paths go through the mtime/size-keyed reader cache.
+    """
+    if hasattr(source, "read"):
+        source.seek(0)
+        reader = pypdf.PdfReader(source)
+        reader._pdf_mcp_lock = threading.Lock()
+        return reader
+
+    stat_result = Path(source).stat()
+    return _open_reader(str(source), stat_result.st_mtime_ns, stat_result.st_size)
+
 
 class PDFObjectTreeParser:
     """Parser for PDF object trees with support for lazy loading and path navigation.
@@ -42,23 +114,35 @@ class PDFObjectTreeParser:
     It also supports path navigation (e.g., "Pages.Kids.0") and selective object resolution.
     """
 
+    # Fixed attribute layout: no per-instance __dict__, and slot access is a
+    # direct offset load rather than a dict probe in the serializer hot path
+    __slots__ = (
+        "indirect_objects",
+        "visited_refs",
+        "lazy_mode",
+        "_include_stream_length",
+    )
+
     def __init__(self) -> None:
-        self.indirect_objects: dict[str, PDFObject] = {}
-        self.visited_refs: set[str] = set()
+        self.indirect_objects: dict[tuple[int, int], PDFObject] = {}
+        self.visited_refs: set[tuple[int, int]] = set()
         self.lazy_mode: bool = False
+        self._include_stream_length: bool = False
 
     def parse_pdf_lazy(
         self,
-        pdf_path: str | Path,
+        pdf_path: str | Path | BinaryIO,
         target_object_id: str | None = None,
         path: str | None = None,
+        include_stream_length: bool = False,
     ) -> LazyParseResponse:
         """Parse PDF with lazy loading - only returns indirect references without resolving them.
 
         Args:
-            pdf_path: Path to the PDF file
+            pdf_path: Path to the PDF file, or an open binary stream
             target_object_id: Optional specific object ID to retrieve (e.g., '1 0')
             path: Optional object path to navigate (e.g., 'Pages.Kids.0')
+            include_stream_length: Whether to decode stream bodies to report their length
 
         Returns:
             LazyParseResponse containing only the result object with unresolved references
@@ -68,28 +152,29 @@ class PDFObjectTreeParser:
             InvalidObjectIDError: If target_object_id has invalid format
             InvalidPathError: If path navigation fails
         """
-        self._reset_state(lazy_mode=True)
-        pdf_path = Path(pdf_path)
+        self._reset_state(lazy_mode=True, include_stream_length=include_stream_length)
 
-        if not pdf_path.exists():
+        if not hasattr(pdf_path, "read") and not Path(pdf_path).exists():
             raise PDFParsingError(f"PDF file not found: {pdf_path}")
 
         try:
-            with open(pdf_path, "rb") as file:
-                reader = pypdf.PdfReader(file)
+            reader = _reader_for(pdf_path)
+            with reader._pdf_mcp_lock:
+                self._warm_objstm(reader)
 
                 if target_object_id:
                     result = self._parse_specific_object(reader, target_object_id)
                 else:
                     # Parse root catalog
                     catalog = reader.trailer["/Root"]
-                    result = self._serialize_object(catalog)
 
-                    # Apply path navigation if provided
                     if path:
-                        result = self._navigate_path(result, path, reader)
+                        # Walk the raw objects so only the target node is serialized
+                        result = self._serialize_object(self._navigate_path_raw(catalog, path))
+                    else:
+                        result = self._serialize_object(catalog)
 
-                return LazyParseResponse(result=result)
+            return LazyParseResponse(result=result)
 
         except Exception as e:
             logger.error(f"Failed to parse PDF {pdf_path}: {e}")
@@ -97,16 +182,18 @@ class PDFObjectTreeParser:
 
     def parse_pdf_full(
         self,
-        pdf_path: str | Path,
+        pdf_path: str | Path | BinaryIO,
         target_object_id: str | None = None,
         path: str | None = None,
+        include_stream_length: bool = False,
     ) -> FullParseResponse:
         """Parse PDF with full resolution - resolves all indirect references.
 
         Args:
-            pdf_path: Path to the PDF file
+            pdf_path: Path to the PDF file, or an open binary stream
             target_object_id: Optional specific object ID to retrieve (e.g., '1 0')
             path: Optional object path to navigate (e.g., 'Pages.Kids.0')
+            include_stream_length: Whether to decode stream bodies to report their length
 
         Returns:
             FullParseResponse containing resolved objects and result
@@ -116,43 +203,52 @@ class PDFObjectTreeParser:
             InvalidObjectIDError: If target_object_id has invalid format
             InvalidPathError: If path navigation fails
         """
-        self._reset_state(lazy_mode=False)
-        pdf_path = Path(pdf_path)
+        self._reset_state(lazy_mode=False, include_stream_length=include_stream_length)
 
-        if not pdf_path.exists():
+        if not hasattr(pdf_path, "read") and not Path(pdf_path).exists():
             raise PDFParsingError(f"PDF file not found: {pdf_path}")
 
         try:
-            with open(pdf_path, "rb") as file:
-                reader = pypdf.PdfReader(file)
+            reader = _reader_for(pdf_path)
+            with reader._pdf_mcp_lock:
+                self._warm_objstm(reader)
 
                 if target_object_id:
                     result = self._parse_specific_object(reader, target_object_id)
                 else:
                     # Parse root catalog
                     catalog = reader.trailer["/Root"]
-                    result = self._serialize_object(catalog)
 
-                    # Apply path navigation if provided
                     if path:
-                        result = self._navigate_path(result, path, reader)
+                        # Walk the raw objects so only the target node is serialized
+                        result = self._serialize_object(self._navigate_path_raw(catalog, path))
+                    else:
+                        result = self._serialize_object(catalog)
 
-                return FullParseResponse(indirect_objects=self.indirect_objects, result=result)
+            return FullParseResponse(
+                indirect_objects=self._export_indirect_objects(), result=result
+            )
 
         except Exception as e:
             logger.error(f"Failed to parse PDF {pdf_path}: {e}")
             raise PDFParsingError(f"Error parsing PDF: {e}") from e
 
     def resolve_object(
-        self, pdf_path: str | Path, objnum: int, gennum: int = 0, depth: ResolutionDepth = "shallow"
+        self,
+        pdf_path: str | Path | BinaryIO,
+        objnum: int,
+        gennum: int = 0,
+        depth: ResolutionDepth = "shallow",
+        include_stream_length: bool = False,
     ) -> ShallowResolveResponse | DeepResolveResponse:
         """Resolve a specific indirect object by its object and generation numbers.
 
         Args:
-            pdf_path: Path to PDF file
+            pdf_path: Path to PDF file, or an open binary stream
             objnum: PDF object number
             gennum: PDF generation number (defaults to 0)
             depth: Resolution depth - "shallow" (only direct properties) or "deep" (resolve all nested)
+            include_stream_length: Whether to decode stream bodies to report their length
 
         Returns:
             Response containing the resolved object content
@@ -161,14 +257,13 @@ class PDFObjectTreeParser:
             PDFParsingError: If PDF cannot be parsed
             ObjectNotFoundError: If object is not found in PDF
         """
-        pdf_path = Path(pdf_path)
-
-        if not pdf_path.exists():
+        if not hasattr(pdf_path, "read") and not Path(pdf_path).exists():
             raise PDFParsingError(f"PDF file not found: {pdf_path}")
 
         try:
-            with open(pdf_path, "rb") as file:
-                reader = pypdf.PdfReader(file)
+            reader = _reader_for(pdf_path)
+            with reader._pdf_mcp_lock:
+                self._warm_objstm(reader)
 
                 # Create IndirectObject reference and resolve it
                 try:
@@ -180,17 +275,21 @@ class PDFObjectTreeParser:
                     ) from e
 
                 # Serialize the resolved object
-                self._reset_state(lazy_mode=(depth == "shallow"))
+                self._reset_state(
+                    lazy_mode=(depth == "shallow"), include_stream_length=include_stream_length
+                )
                 result = self._serialize_object(actual_obj)
 
-                object_id = f"{objnum}-{gennum}"
+            object_id = f"{objnum}-{gennum}"
 
-                if depth == "shallow":
-                    return ShallowResolveResponse(object_id=object_id, content=result)
-                else:
-                    return DeepResolveResponse(
-                        object_id=object_id, content=result, indirect_objects=self.indirect_objects
-                    )
+            if depth == "shallow":
+                return ShallowResolveResponse(object_id=object_id, content=result)
+            else:
+                return DeepResolveResponse(
+                    object_id=object_id,
+                    content=result,
+                    indirect_objects=self._export_indirect_objects(),
+                )
 
         except (PDFParsingError, ObjectNotFoundError):
             raise
@@ -198,29 +297,103 @@ class PDFObjectTreeParser:
             logger.error(f"Failed to resolve object {objnum}-{gennum} in {pdf_path}: {e}")
             raise PDFParsingError(f"Error resolving object {objnum}-{gennum}: {e}") from e
 
-    def _reset_state(self, lazy_mode: bool) -> None:
+    def _warm_objstm(self, reader: pypdf.PdfReader) -> None:
+        """Pre-decode compressed object streams into pypdf's object cache.
+
+        pypdf re-scans an object stream's header every time one of its member
+        objects is resolved, which makes repeated ``get_object()`` calls O(N^2)
+        on ObjStm-heavy files. Decoding every member of each stream in a single
+        pass keeps later lookups at O(1), and the stream bodies themselves are
+        decompressed concurrently since zlib releases the GIL.
+        """
+        # Readers are cached and reused across calls; warm each one only once
+        if getattr(reader, "_pdf_mcp_objstm_warmed", False):
+            return
+        reader._pdf_mcp_objstm_warmed = True
+
+        xref_objstm = getattr(reader, "xref_objStm", None)
+        if not xref_objstm:
+            return
+
+        # Group member object numbers by their containing stream
+        streams: dict[int, list[int]] = {}
+        for obj_num, entry in xref_objstm.items():
+            streams.setdefault(entry[0], []).append(obj_num)
+
+        # Resolve the stream objects serially (this touches reader state) ...
+        stream_objs = []
+        for stmnum in streams:
+            try:
+                stream_objs.append((stmnum, IndirectObject(stmnum, 0, reader).get_object()))
+            except Exception:
+                # Fall back to pypdf's per-object resolution for this stream
+                continue
+
+        # ... then decompress the bodies in parallel; get_data() caches the
+        # decoded bytes on each stream object, so this only front-loads work
+        decoded: list[tuple[int, Any, bytes]] = []
+        if len(stream_objs) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(stream_objs))) as pool:
+                futures = [pool.submit(lambda e: (*e, e[1].get_data()), e) for e in stream_objs]
+                for future in futures:
+                    try:
+                        decoded.append(future.result())
+                    except Exception:
+                        continue
+        else:
+            for entry in stream_objs:
+                try:
+                    decoded.append((*entry, entry[1].get_data()))
+                except Exception:
+                    continue
+
+        for stmnum, obj_stm, raw_data in decoded:
+            try:
+                count = int(obj_stm["/N"])
+                first = int(obj_stm["/First"])
+                data = BytesIO(raw_data)
+                header = data.read(first).split()
+            except Exception:
+                continue
+
+            for i in range(0, min(2 * count, len(header) - 1), 2):
+                obj_num, offset = int(header[i]), int(header[i + 1])
+
+                # Skip entries shadowed by a newer object stream
+                if obj_num not in xref_objstm or xref_objstm[obj_num][0] != stmnum:
+                    continue
+                if reader.cache_get_indirect_object(0, obj_num) is not None:
+                    continue
+
+                data.seek(first + offset)
+                try:
+                    obj = read_object(data, reader)
+                except Exception:
+                    continue
+                reader.cache_indirect_object(0, obj_num, obj)
+
+    def _reset_state(self, lazy_mode: bool, include_stream_length: bool = False) -> None:
         """Reset parser state for a new operation."""
         self.indirect_objects = {}
         self.visited_refs = set()
         self.lazy_mode = lazy_mode
+        self._include_stream_length = include_stream_length
+
+    def _export_indirect_objects(self) -> dict[str, PDFObject]:
+        """Render the tuple-keyed indirect objects with 'objnum-gennum' keys."""
+        return {
+            f"{objnum}-{gennum}": obj for (objnum, gennum), obj in self.indirect_objects.items()
+        }
 
     def _parse_specific_object(self, reader: pypdf.PdfReader, target_object_id: str) -> PDFObject:
         """Parse a specific object by ID."""
         try:
-            parts = target_object_id.split()
-            if len(parts) < 2:
-                raise InvalidObjectIDError(
-                    f"Invalid object ID format: {target_object_id}. Expected format: '1 0'"
-                )
-
-            obj_num, gen_num = int(parts[0]), int(parts[1])
+            obj_num, gen_num = _parse_object_id(target_object_id)
             indirect_ref = IndirectObject(obj_num, gen_num, reader)
             return self._serialize_object(indirect_ref)
 
-        except ValueError as e:
-            raise InvalidObjectIDError(
-                f"Invalid object ID format: {target_object_id}. Expected format: '1 0'"
-            ) from e
+        except InvalidObjectIDError:
+            raise
         except Exception as e:
             raise ObjectNotFoundError(
                 f"Object {target_object_id} not found in PDF", details=str(e)
@@ -229,103 +402,232 @@ class PDFObjectTreeParser:
     def _serialize_object(self, obj: Any) -> PDFObject:
         """Convert PDF object to JSON-serializable format.
 
+        The walk uses an explicit work stack instead of recursion so deeply
+        nested structures (Pages trees, long reference chains) cannot hit
+        CPython's recursion limit.
+
         Args:
             obj: PyPDF object to serialize
 
         Returns:
             Serialized PDF object
         """
-        if isinstance(obj, IndirectObject):
-            ref_id = f"{obj.idnum}-{obj.generation}"
-            objnum = obj.idnum
-            gennum = obj.generation if obj.generation != 0 else None
+        root: list[Any] = [None]
+        stack: list[tuple[Any, Any, Any]] = [(obj, root, 0)]
 
-            if self.lazy_mode:
-                # In lazy mode, just return the reference without resolving
-                return {"type": "indirect_ref", "objnum": objnum, "gennum": gennum}
+        # Bind the loop's attribute lookups once; on large trees this loop
+        # runs once per node, so the repeated LOAD_ATTR/LOAD_METHOD work is
+        # measurable interpreter overhead.
+        pop = stack.pop
+        serialize_node = self._serialize_node
 
-            if ref_id in self.visited_refs:
-                return {"type": "indirect_ref", "objnum": objnum, "gennum": gennum}
+        while stack:
+            node, container, slot = pop()
+            container[slot] = serialize_node(node, stack)
 
-            self.visited_refs.add(ref_id)
+        return root[0]
 
-            # Get the actual object
-            actual_obj = obj.get_object()
-            serialized = self._serialize_object(actual_obj)
+    def _serialize_node(
+        self,
+        obj: Any,
+        stack: list[tuple[Any, Any, Any]],
+    ) -> Any:
+        """Serialize a single node, pushing child work items onto the stack.
+
+        Dispatch is an O(1) exact-type lookup in _HANDLERS; subclasses of the
+        pypdf types fall back to an isinstance chain. Container nodes return a
+        shell whose child slots are filled in place as the corresponding
+        stack frames are processed.
+        """
+        handler = self._HANDLERS.get(type(obj))
+        if handler is not None:
+            return handler(self, obj, stack)
 
-            # Store in indirect_objects
-            self.indirect_objects[ref_id] = serialized
+        # Fallback for subclasses of the pypdf types. StreamObject subclasses
+        # DictionaryObject, so it must be checked first.
+        if isinstance(obj, IndirectObject):
+            return self._serialize_indirect_ref(obj, stack)
+        elif isinstance(obj, StreamObject):
+            return self._serialize_stream(obj, stack)
+        elif isinstance(obj, DictionaryObject):
+            return self._serialize_dict(obj, stack)
+        elif isinstance(obj, ArrayObject):
+            return self._serialize_array(obj, stack)
+        elif isinstance(obj, NameObject):
+            return self._serialize_name(obj, stack)
+        elif isinstance(obj, (TextStringObject, ByteStringObject)):
+            return self._serialize_string(obj, stack)
+        elif isinstance(obj, (NumberObject, FloatObject)):
+            return self._serialize_number(obj, stack)
+        elif isinstance(obj, BooleanObject):
+            return self._serialize_boolean(obj, stack)
+        elif isinstance(obj, NullObject):
+            return self._serialize_null(obj, stack)
+        else:
+            return self._serialize_unknown(obj, stack)
 
+    def _serialize_indirect_ref(
+        self,
+        obj: Any,
+        stack: list[tuple[Any, Any, Any]],
+    ) -> Any:
+        # Tuple keys avoid formatting a string per reference; keys are only
+        # rendered as 'objnum-gennum' when the response is exported
+        ref_key = (obj.idnum, obj.generation)
+        objnum = obj.idnum
+        gennum = obj.generation if obj.generation != 0 else None
+
+        if self.lazy_mode:
+            # In lazy mode, just return the reference without resolving
             return {"type": "indirect_ref", "objnum": objnum, "gennum": gennum}
 
-        elif isinstance(obj, DictionaryObject):
-            result = {"type": "dict", "value": {}}
-            for key, value in obj.items():
-                key_str = str(key) if isinstance(key, NameObject) else key
-                result["value"][key_str] = self._serialize_object(value)
-            return result
+        if ref_key in self.visited_refs:
+            return {"type": "indirect_ref", "objnum": objnum, "gennum": gennum}
 
-        elif isinstance(obj, ArrayObject):
-            return {"type": "array", "value": [self._serialize_object(item) for item in obj]}
+        self.visited_refs.add(ref_key)
 
-        elif isinstance(obj, StreamObject):
-            # For streams, include dictionary and indicate data presence
-            return {
-                "type": "stream",
-                "dictionary": self._serialize_object(dict(obj)),
-                "has_data": True,
-                "data_length": len(obj.get_data()) if hasattr(obj, "get_data") else None,
-            }
+        # Serialize the resolved object into indirect_objects
+        stack.append((obj.get_object(), self.indirect_objects, ref_key))
 
-        elif isinstance(obj, NameObject):
-            return {"type": "name", "value": str(obj)}
+        return {"type": "indirect_ref", "objnum": objnum, "gennum": gennum}
 
-        elif isinstance(obj, (TextStringObject, ByteStringObject)):
-            try:
-                return {
-                    "type": "string",
-                    "value": str(obj),
-                    "encoding": "text" if isinstance(obj, TextStringObject) else "bytes",
-                }
-            except Exception:
-                return {"type": "string", "value": repr(obj), "encoding": "bytes"}
+    def _serialize_stream(
+        self,
+        obj: Any,
+        stack: list[tuple[Any, Any, Any]],
+    ) -> Any:
+        # For streams, include dictionary and indicate data presence; the
+        # entries are serialized in place rather than through a dict(obj) copy
+        dictionary: dict[str, Any] = {}
+        for key, item in obj.items():
+            key_str = str(key) if isinstance(key, NameObject) else key
+            dictionary[key_str] = None
+            stack.append((item, dictionary, key_str))
+        return {
+            "type": "stream",
+            "dictionary": {"type": "dict", "value": dictionary},
+            "has_data": True,
+            "data_length": (
+                len(obj.get_data())
+                if self._include_stream_length and hasattr(obj, "get_data")
+                else None
+            ),
+        }
+
+    def _serialize_dict(
+        self,
+        obj: Any,
+        stack: list[tuple[Any, Any, Any]],
+    ) -> Any:
+        value: dict[str, Any] = {}
+        for key, item in obj.items():
+            key_str = str(key) if isinstance(key, NameObject) else key
+            value[key_str] = None
+            stack.append((item, value, key_str))
+        return {"type": "dict", "value": value}
+
+    def _serialize_array(
+        self,
+        obj: Any,
+        stack: list[tuple[Any, Any, Any]],
+    ) -> Any:
+        items: list[Any] = [None] * len(obj)
+        for index, item in enumerate(obj):
+            stack.append((item, items, index))
+        return {"type": "array", "value": items}
+
+    def _serialize_name(
+        self,
+        obj: Any,
+        stack: list[tuple[Any, Any, Any]],
+    ) -> Any:
+        return {"type": "name", "value": str(obj)}
 
-        elif isinstance(obj, (NumberObject, FloatObject)):
+    def _serialize_string(
+        self,
+        obj: Any,
+        stack: list[tuple[Any, Any, Any]],
+    ) -> Any:
+        try:
             return {
-                "type": "number",
-                "value": float(obj) if isinstance(obj, FloatObject) else int(obj),
+                "type": "string",
+                "value": str(obj),
+                "encoding": "text" if isinstance(obj, TextStringObject) else "bytes",
             }
+        except Exception:
+            return {"type": "string", "value": repr(obj), "encoding": "bytes"}
 
-        elif isinstance(obj, BooleanObject):
-            return {"type": "boolean", "value": bool(obj)}
-
-        elif isinstance(obj, NullObject):
-            return {"type": "null", "value": None}
+    def _serialize_number(
+        self,
+        obj: Any,
+        stack: list[tuple[Any, Any, Any]],
+    ) -> Any:
+        return {
+            "type": "number",
+            "value": float(obj) if isinstance(obj, FloatObject) else int(obj),
+        }
+
+    def _serialize_boolean(
+        self,
+        obj: Any,
+        stack: list[tuple[Any, Any, Any]],
+    ) -> Any:
+        return {"type": "boolean", "value": bool(obj)}
 
-        else:
-            # Fallback for unknown types
-            return {"type": "unknown", "python_type": type(obj).__name__, "value": str(obj)}
+    def _serialize_null(
+        self,
+        obj: Any,
+        stack: list[tuple[Any, Any, Any]],
+    ) -> Any:
+        return {"type": "null", "value": None}
 
-    def _navigate_path(self, obj: PDFObject, path: str, reader: pypdf.PdfReader) -> PDFObject:
-        """Navigate through object path like 'Pages.Kids.0'.
+    def _serialize_unknown(
+        self,
+        obj: Any,
+        stack: list[tuple[Any, Any, Any]],
+    ) -> Any:
+        # Fallback for unknown types
+        return {"type": "unknown", "python_type": type(obj).__name__, "value": str(obj)}
+
+    # Exact-type dispatch table for _serialize_node; one hash lookup replaces
+    # the isinstance ladder for the common pypdf types.
+    _HANDLERS: dict[type, Any] = {
+        IndirectObject: _serialize_indirect_ref,
+        StreamObject: _serialize_stream,
+        DictionaryObject: _serialize_dict,
+        ArrayObject: _serialize_array,
+        NameObject: _serialize_name,
+        TextStringObject: _serialize_string,
+        ByteStringObject: _serialize_string,
+        NumberObject: _serialize_number,
+        FloatObject: _serialize_number,
+        BooleanObject: _serialize_boolean,
+        NullObject: _serialize_null,
+    }
+
+    def _navigate_path_raw(self, start_obj: Any, path: str) -> Any:
+        """Navigate a dot-separated path over raw pypdf objects.
+
+        Walking the unserialized objects keeps navigation proportional to the
+        path depth: only the node the caller asked for gets serialized,
+        instead of the entire subtree the path starts from.
 
         Args:
-            obj: Starting object
+            start_obj: PyPDF object to start from (usually the catalog)
             path: Dot-separated path to navigate
-            reader: PDF reader for resolving references
 
         Returns:
-            Object at the specified path
+            Raw PyPDF object at the specified path
 
         Raises:
             InvalidPathError: If path navigation fails
         """
         parts = path.split(".")
-        current = obj
+        current = start_obj
 
         for i, part in enumerate(parts):
             try:
-                current = self._navigate_single_step(current, part, reader)
+                current = self._navigate_single_step_raw(current, part)
             except Exception as e:
                 current_path = ".".join(parts[: i + 1])
                 raise InvalidPathError(
@@ -335,69 +637,47 @@ class PDFObjectTreeParser:
 
         return current
 
-    def _navigate_single_step(
-        self, obj: PDFObject, step: str, reader: pypdf.PdfReader
-    ) -> PDFObject:
-        """Navigate a single step in the path.
+    def _navigate_single_step_raw(self, obj: Any, step: str) -> Any:
+        """Navigate a single path step on a raw pypdf object.
 
         Args:
-            obj: Current object
+            obj: Current PyPDF object (indirect references are resolved)
             step: Navigation step (key name or array index)
-            reader: PDF reader for resolving references
 
         Returns:
-            Object after navigation step
+            Raw PyPDF object after the navigation step
 
         Raises:
             InvalidPathError: If navigation step fails
         """
-        # If this is an indirect reference, resolve it first
-        if isinstance(obj, dict) and obj.get("type") == "indirect_ref":
-            objnum = obj["objnum"]
-            gennum = obj.get("gennum", 0)
-            ref_id = f"{objnum}-{gennum}"
-
-            if ref_id in self.indirect_objects:
-                obj = self.indirect_objects[ref_id]
-            else:
-                # Need to resolve the reference
-                indirect_ref = IndirectObject(objnum, gennum, reader)
-                actual_obj = indirect_ref.get_object()
-                obj = self._serialize_object(actual_obj)
-
-        # Handle dictionary navigation
-        if isinstance(obj, dict) and obj.get("type") == "dict":
-            dict_value = obj.get("value", {})
+        if isinstance(obj, IndirectObject):
+            obj = obj.get_object()
 
+        if isinstance(obj, DictionaryObject):
             # Try with leading slash (PDF name convention)
             key_with_slash = f"/{step}"
-            if key_with_slash in dict_value:
-                return dict_value[key_with_slash]
+            if key_with_slash in obj:
+                return obj.raw_get(key_with_slash)
 
-            # Try without slash
-            if step in dict_value:
-                return dict_value[step]
+            if step in obj:
+                return obj.raw_get(step)
 
-            available_keys = list(dict_value.keys())
+            available_keys = [str(key) for key in obj.keys()]
             raise InvalidPathError(
                 f"Key '{step}' not found in dictionary", details=f"Available keys: {available_keys}"
             )
 
-        # Handle array navigation
-        elif isinstance(obj, dict) and obj.get("type") == "array":
-            array_value = obj.get("value", [])
+        elif isinstance(obj, ArrayObject):
             try:
                 index = int(step)
-                if 0 <= index < len(array_value):
-                    return array_value[index]
-                else:
-                    raise InvalidPathError(
-                        f"Array index {index} out of range",
-                        details=f"Array length: {len(array_value)}",
-                    )
             except ValueError as e:
                 raise InvalidPathError(f"Invalid array index: '{step}'") from e
 
+            if 0 <= index < len(obj):
+                return obj[index]
+            raise InvalidPathError(
+                f"Array index {index} out of range", details=f"Array length: {len(obj)}"
+            )
+
         else:
-            obj_type = obj.get("type", "unknown") if isinstance(obj, dict) else type(obj).__name__
-            raise InvalidPathError(f"Cannot navigate into object of type: {obj_type}")
+            raise InvalidPathError(f"Cannot navigate into object of type: {type(obj).__name__}")
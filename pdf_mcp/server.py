@@ -1,10 +1,12 @@
 """Nutrient PDF MCP Server - Advanced PDF object tree investigation with lazy loading support."""
 
 import asyncio
+import io
 import json
 import logging
 from pathlib import Path
-from typing import Any
+from types import ModuleType
+from typing import Any, Literal, overload
 
 import mcp.server.stdio
 import mcp.types as types
@@ -13,12 +15,48 @@ from mcp.server.models import InitializationOptions, ServerCapabilities
 
 from .exceptions import PDFMCPError
 from .parser import PDFObjectTreeParser
+from .types import (
+    DeepResolveResponse,
+    FullParseResponse,
+    LazyParseResponse,
+    ShallowResolveResponse,
+)
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - optional C encoder, stdlib json works too
+    _orjson = None  # type: ignore[assignment]
+
+# Typed as optional so mypy keeps the stdlib fallback below reachable even
+# when orjson is installed in the checking environment
+orjson: ModuleType | None = _orjson
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _render_json(payload: Any) -> str:
+    """Serialize a response payload by streaming encoder output into one buffer.
+
+    Uses ``orjson`` (a C encoder, several times faster on dict-heavy trees)
+    when available. The stdlib fallback streams via ``json.dump``, which
+    writes chunks straight into the buffer instead of materializing the
+    intermediate fragment list that ``json.dumps`` joins.
+
+    ``types.TextContent`` only accepts ``str``, so orjson's UTF-8 bytes are
+    decoded exactly once here at the transport boundary; everything up to
+    this point stays in bytes.
+    """
+    if orjson is not None:
+        rendered: bytes = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+        return rendered.decode()
+
+    buffer = io.StringIO()
+    json.dump(payload, buffer, indent=2)
+    return buffer.getvalue()
+
+
 class PDFMCPServer:
     """Nutrient PDF MCP Server - Advanced PDF object tree investigation.
 
@@ -30,7 +68,6 @@ class PDFMCPServer:
 
     def __init__(self, name: str = "nutrient-pdf-mcp") -> None:
         self.server: Server = Server(name)
-        self.parser = PDFObjectTreeParser()
         self._setup_handlers()
 
     def _setup_handlers(self) -> None:
@@ -61,6 +98,11 @@ class PDFMCPServer:
                                 "enum": ["lazy", "full"],
                                 "default": "lazy",
                             },
+                            "include_stream_length": {
+                                "type": "boolean",
+                                "description": "Optional: decode stream bodies to report their decoded length (expensive, defaults to false)",
+                                "default": False,
+                            },
                         },
                         "required": ["pdf_path"],
                     },
@@ -87,6 +129,11 @@ class PDFMCPServer:
                                 "enum": ["shallow", "deep"],
                                 "default": "shallow",
                             },
+                            "include_stream_length": {
+                                "type": "boolean",
+                                "description": "Optional: decode stream bodies to report their decoded length (expensive, defaults to false)",
+                                "default": False,
+                            },
                         },
                         "required": ["pdf_path", "objnum"],
                     },
@@ -106,20 +153,35 @@ class PDFMCPServer:
             except PDFMCPError as e:
                 logger.error(f"PDF MCP error in {name}: {e.message}")
                 error_response = {"error": e.message, "details": e.details, "tool": name}
-                return [types.TextContent(type="text", text=json.dumps(error_response, indent=2))]
+                return [types.TextContent(type="text", text=_render_json(error_response))]
             except Exception as e:
                 logger.error(f"Unexpected error in {name}: {e}")
                 error_response = {"error": f"Internal server error: {str(e)}", "tool": name}
-                return [types.TextContent(type="text", text=json.dumps(error_response, indent=2))]
+                return [types.TextContent(type="text", text=_render_json(error_response))]
+
+    @overload
+    async def _handle_get_pdf_object_tree(
+        self, arguments: dict[str, Any], _return_dict: Literal[False] = ...
+    ) -> list[types.TextContent]: ...
 
+    @overload
     async def _handle_get_pdf_object_tree(
-        self, arguments: dict[str, Any]
-    ) -> list[types.TextContent]:
-        """Handle get_pdf_object_tree tool calls."""
+        self, arguments: dict[str, Any], _return_dict: Literal[True]
+    ) -> LazyParseResponse | FullParseResponse: ...
+
+    async def _handle_get_pdf_object_tree(
+        self, arguments: dict[str, Any], _return_dict: bool = False
+    ) -> list[types.TextContent] | LazyParseResponse | FullParseResponse:
+        """Handle get_pdf_object_tree tool calls.
+
+        ``_return_dict`` is an internal hook for tests: it returns the raw
+        response payload and skips JSON rendering entirely.
+        """
         pdf_path = arguments.get("pdf_path")
         object_id = arguments.get("object_id")
         path_arg = arguments.get("path")
         mode = arguments.get("mode", "lazy")
+        include_stream_length = arguments.get("include_stream_length", False)
 
         if not pdf_path:
             raise ValueError("pdf_path is required")
@@ -130,21 +192,46 @@ class PDFMCPServer:
 
         logger.info(f"Parsing PDF {pdf_path} in {mode} mode")
 
+        # Parsing is blocking I/O plus CPU work; run it in a worker thread so
+        # the stdio event loop stays responsive. The parser holds per-call
+        # state, so each request gets its own instance.
+        parser = PDFObjectTreeParser()
         if mode == "lazy":
-            result = self.parser.parse_pdf_lazy(str(path), object_id, path_arg)
+            result = await asyncio.to_thread(
+                parser.parse_pdf_lazy, str(path), object_id, path_arg, include_stream_length
+            )
         else:
-            result = self.parser.parse_pdf_full(str(path), object_id, path_arg)
+            result = await asyncio.to_thread(
+                parser.parse_pdf_full, str(path), object_id, path_arg, include_stream_length
+            )
 
-        return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+        if _return_dict:
+            return result
+        return [types.TextContent(type="text", text=_render_json(result))]
 
+    @overload
     async def _handle_resolve_indirect_object(
-        self, arguments: dict[str, Any]
-    ) -> list[types.TextContent]:
-        """Handle resolve_indirect_object tool calls."""
+        self, arguments: dict[str, Any], _return_dict: Literal[False] = ...
+    ) -> list[types.TextContent]: ...
+
+    @overload
+    async def _handle_resolve_indirect_object(
+        self, arguments: dict[str, Any], _return_dict: Literal[True]
+    ) -> ShallowResolveResponse | DeepResolveResponse: ...
+
+    async def _handle_resolve_indirect_object(
+        self, arguments: dict[str, Any], _return_dict: bool = False
+    ) -> list[types.TextContent] | ShallowResolveResponse | DeepResolveResponse:
+        """Handle resolve_indirect_object tool calls.
+
+        ``_return_dict`` is an internal hook for tests: it returns the raw
+        response payload and skips JSON rendering entirely.
+        """
         pdf_path = arguments.get("pdf_path")
         objnum = arguments.get("objnum")
         gennum = arguments.get("gennum", 0)
         depth = arguments.get("depth", "shallow")
+        include_stream_length = arguments.get("include_stream_length", False)
 
         if not pdf_path:
             raise ValueError("pdf_path is required")
@@ -157,9 +244,14 @@ class PDFMCPServer:
 
         logger.info(f"Resolving object {objnum}-{gennum} from {pdf_path} with {depth} depth")
 
-        result = self.parser.resolve_object(str(path), objnum, gennum, depth)
+        parser = PDFObjectTreeParser()
+        result = await asyncio.to_thread(
+            parser.resolve_object, str(path), objnum, gennum, depth, include_stream_length
+        )
 
-        return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+        if _return_dict:
+            return result
+        return [types.TextContent(type="text", text=_render_json(result))]
 
     async def run(self) -> None:
         """Run the MCP server."""
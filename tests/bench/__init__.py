@@ -0,0 +1 @@
+"""Benchmarks for the PDF MCP server (run with pytest --benchmark-enable)."""
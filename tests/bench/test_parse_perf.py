@@ -0,0 +1,31 @@
+"""Benchmarks for lazy and full PDF parsing.
+
+Disabled by default via ``--benchmark-disable`` in pyproject.toml so CI pays
+only a single plain call per benchmark; run the statistical comparison with::
+
+    pytest --benchmark-enable tests/bench/
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.integration
+def test_parse_pdf_lazy_benchmark(benchmark, parser, sample_pdf_path, warm_reader_cache):
+    """Benchmark the lazy catalog parse against the cached reader."""
+    if not sample_pdf_path.exists():
+        pytest.skip("Sample PDF not available")
+
+    result = benchmark(parser.parse_pdf_lazy, str(sample_pdf_path))
+    assert "result" in result
+
+
+@pytest.mark.integration
+def test_parse_pdf_full_benchmark(benchmark, parser, sample_pdf_path, warm_reader_cache):
+    """Benchmark the full parse, the heaviest path the server exposes."""
+    if not sample_pdf_path.exists():
+        pytest.skip("Sample PDF not available")
+
+    result = benchmark(parser.parse_pdf_full, str(sample_pdf_path))
+    assert len(result["indirect_objects"]) > 0
@@ -0,0 +1,155 @@
+"""Shared pytest fixtures for the test suite."""
+
+import io
+from pathlib import Path
+
+import pytest
+
+from pdf_mcp.parser import PDFObjectTreeParser, _open_reader
+from pdf_mcp.server import PDFMCPServer
+
+
+@pytest.fixture
+def parser():
+    """Create a fresh parser instance per test."""
+    return PDFObjectTreeParser()
+
+
+@pytest.fixture(scope="session")
+def server():
+    """Create a server instance, shared per worker.
+
+    Handlers build a fresh parser per request and hold no cross-call state,
+    so one instance can serve the whole session.
+    """
+    return PDFMCPServer("test-server")
+
+
+@pytest.fixture(scope="session")
+def sample_pdf_path():
+    """Path to sample PDF."""
+    return Path("tests/fixtures/document.pdf")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_reader_cache(sample_pdf_path):
+    """Prime the parser's reader cache for the sample PDF once per worker.
+
+    Every path-based parser call in the session then hits the cached,
+    already-parsed reader. The cache is cleared at teardown so repeated
+    in-process runs don't accumulate stale mmap handles.
+    """
+    if sample_pdf_path.exists():
+        stat_result = sample_pdf_path.stat()
+        _open_reader(str(sample_pdf_path), stat_result.st_mtime_ns, stat_result.st_size)
+    yield
+    _open_reader.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def parser_session(sample_pdf_path):
+    """Session-wide parser for read-only probes of the sample PDF."""
+    if not sample_pdf_path.exists():
+        pytest.skip("Sample PDF not available")
+    return PDFObjectTreeParser()
+
+
+@pytest.fixture(scope="session")
+def sample_pdf_bytes(sample_pdf_path):
+    """Raw bytes of the sample PDF, read from disk once per session."""
+    if not sample_pdf_path.exists():
+        pytest.skip("Sample PDF not available")
+    return sample_pdf_path.read_bytes()
+
+
+@pytest.fixture(scope="session")
+def pages_ref(parser_session, sample_pdf_path):
+    """(objnum, gennum) of the catalog's Pages reference, probed once per session.
+
+    None when the sample PDF inlines Pages rather than referencing it.
+    """
+    result = parser_session.parse_pdf_lazy(str(sample_pdf_path), path="Pages")["result"]
+    if result["type"] != "indirect_ref":
+        return None
+    return result["objnum"], result["gennum"] or 0
+
+
+@pytest.fixture(scope="session")
+def pages_content(parser_session, sample_pdf_path, pages_ref):
+    """Shallow resolution of the Pages object, run once per session."""
+    if pages_ref is None:
+        pytest.skip("Sample PDF inlines Pages")
+    objnum, gennum = pages_ref
+    return parser_session.resolve_object(str(sample_pdf_path), objnum, gennum, "shallow")
+
+
+@pytest.fixture(scope="session")
+def first_page_ref(pages_content):
+    """(objnum, gennum) of the first /Kids entry of the Pages object."""
+    kids = pages_content["content"]["value"].get("/Kids")
+    if not kids or kids["type"] != "array" or not kids["value"]:
+        pytest.skip("Sample PDF has no /Kids array")
+    ref = kids["value"][0]
+    if ref["type"] != "indirect_ref":
+        pytest.skip("First /Kids entry is not an indirect reference")
+    return ref["objnum"], ref["gennum"] or 0
+
+
+@pytest.fixture(scope="session")
+def first_page_content(parser_session, sample_pdf_path, first_page_ref):
+    """Shallow resolution of the first page object, run once per session."""
+    objnum, gennum = first_page_ref
+    return parser_session.resolve_object(str(sample_pdf_path), objnum, gennum, "shallow")
+
+
+@pytest.fixture
+def sample_pdf_stream(sample_pdf_bytes):
+    """In-memory stream over the sample PDF.
+
+    Function-scoped so each test gets its own cursor; the underlying bytes
+    are read from disk only once per session.
+    """
+    return io.BytesIO(sample_pdf_bytes)
+
+
+@pytest.fixture(scope="session")
+def lazy_tree(parser_session, sample_pdf_path):
+    """Lazy parse of the sample PDF catalog, run once per session."""
+    return parser_session.parse_pdf_lazy(str(sample_pdf_path))
+
+
+@pytest.fixture(scope="session")
+async def sample_pages_ref(server, sample_pdf_path):
+    """Pages (objnum, gennum) probed through the server once per session.
+
+    None when the sample PDF inlines Pages rather than referencing it.
+    """
+    if not sample_pdf_path.exists():
+        pytest.skip("Sample PDF not available")
+    response = await server._handle_get_pdf_object_tree(
+        {"pdf_path": str(sample_pdf_path), "path": "Pages", "mode": "lazy"}, _return_dict=True
+    )
+    ref = response["result"]
+    if ref["type"] != "indirect_ref":
+        return None
+    return ref["objnum"], ref["gennum"] or 0
+
+
+@pytest.fixture(scope="session")
+async def server_lazy_response(server, sample_pdf_path):
+    """Server-level lazy parse of the sample PDF, run once per session."""
+    if not sample_pdf_path.exists():
+        pytest.skip("Sample PDF not available")
+    return await server._handle_get_pdf_object_tree(
+        {"pdf_path": str(sample_pdf_path), "mode": "lazy"}
+    )
+
+
+@pytest.fixture(scope="session")
+async def server_full_response(server, sample_pdf_path):
+    """Server-level full parse of the sample PDF, run once per session."""
+    if not sample_pdf_path.exists():
+        pytest.skip("Sample PDF not available")
+    return await server._handle_get_pdf_object_tree(
+        {"pdf_path": str(sample_pdf_path), "mode": "full"}
+    )
@@ -1,131 +1,90 @@
 """Integration tests for the complete PDF MCP system."""
 
 import json
-from pathlib import Path
 
 import pytest
 
-from pdf_mcp.parser import PDFObjectTreeParser
-from pdf_mcp.server import PDFMCPServer
+from pdf_mcp.exceptions import InvalidPathError, PDFParsingError
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional C codec, stdlib json works too
+    orjson = None
 
-class TestIntegration:
-    """Integration tests for the complete system."""
-
-    @pytest.fixture
-    def parser(self):
-        """Create a parser instance."""
-        return PDFObjectTreeParser()
+# orjson decodes/encodes dict-heavy trees several times faster than stdlib
+# json, which matters for the full-parse payloads these tests shuttle around
+_loads = orjson.loads if orjson is not None else json.loads
 
-    @pytest.fixture
-    def server(self):
-        """Create a server instance."""
-        return PDFMCPServer("test-integration")
 
-    @pytest.fixture
-    def sample_pdf_path(self):
-        """Path to sample PDF."""
-        return Path("tests/fixtures/document.pdf")
+class TestIntegration:
+    """Integration tests for the complete system."""
 
     @pytest.mark.integration
-    @pytest.mark.slow
-    def test_complete_pdf_exploration_workflow(self, parser, sample_pdf_path):
-        """Test a complete PDF exploration workflow."""
-        if not sample_pdf_path.exists():
-            pytest.skip("Sample PDF not available")
+    def test_lazy_overview(self, lazy_tree):
+        """Lazy catalog parse returns a result tree."""
+        assert "result" in lazy_tree
+        assert isinstance(lazy_tree["result"], dict)
 
-        # Step 1: Get overview with lazy loading
-        lazy_result = parser.parse_pdf_lazy(str(sample_pdf_path))
-        assert "result" in lazy_result
-
-        # Step 2: Navigate to Pages
-        pages_result = parser.parse_pdf_lazy(str(sample_pdf_path), path="Pages")
-        assert "result" in pages_result
-        assert pages_result["result"]["type"] == "indirect_ref"
-
-        pages_objnum = pages_result["result"]["objnum"]
-        pages_gennum = pages_result["result"]["gennum"] or 0
-
-        # Step 3: Resolve Pages object (shallow)
-        pages_content = parser.resolve_object(
-            str(sample_pdf_path), pages_objnum, pages_gennum, "shallow"
-        )
-        assert "object_id" in pages_content
-        assert "content" in pages_content
-        assert pages_content["object_id"] == f"{pages_objnum}-{pages_gennum}"
+    @pytest.mark.integration
+    def test_pages_is_indirect_ref(self, pages_ref):
+        """The catalog's Pages entry is an indirect reference."""
+        assert pages_ref is not None
 
-        # Verify Pages object structure
+    @pytest.mark.integration
+    def test_pages_type_is_pages(self, pages_ref, pages_content):
+        """Resolving the Pages reference yields a /Pages dictionary."""
+        objnum, gennum = pages_ref
+        assert pages_content["object_id"] == f"{objnum}-{gennum}"
         pages_dict = pages_content["content"]
         assert pages_dict["type"] == "dict"
-        assert "/Type" in pages_dict["value"]
         assert pages_dict["value"]["/Type"]["value"] == "/Pages"
 
-        # Step 4: Navigate to first page
-        if "/Kids" in pages_dict["value"]:
-            kids_array = pages_dict["value"]["/Kids"]
-            if kids_array["type"] == "array" and len(kids_array["value"]) > 0:
-                first_page_ref = kids_array["value"][0]
-                assert first_page_ref["type"] == "indirect_ref"
-
-                # Step 5: Resolve first page
-                first_page_objnum = first_page_ref["objnum"]
-                first_page_gennum = first_page_ref["gennum"] or 0
-                page_content = parser.resolve_object(
-                    str(sample_pdf_path), first_page_objnum, first_page_gennum, "shallow"
-                )
-
-                assert page_content["object_id"] == f"{first_page_objnum}-{first_page_gennum}"
-                page_dict = page_content["content"]
-                assert page_dict["type"] == "dict"
-                assert "/Type" in page_dict["value"]
-                assert page_dict["value"]["/Type"]["value"] == "/Page"
+    @pytest.mark.integration
+    def test_kids_array_nonempty(self, pages_content):
+        """The Pages object carries a non-empty /Kids array."""
+        kids = pages_content["content"]["value"].get("/Kids")
+        assert kids is not None
+        assert kids["type"] == "array"
+        assert len(kids["value"]) > 0
 
     @pytest.mark.integration
-    def test_path_navigation_comprehensive(self, parser, sample_pdf_path):
-        """Test comprehensive path navigation scenarios."""
-        if not sample_pdf_path.exists():
-            pytest.skip("Sample PDF not available")
+    def test_first_page_is_page(self, first_page_ref, first_page_content):
+        """Resolving the first /Kids entry yields a /Page dictionary."""
+        objnum, gennum = first_page_ref
+        assert first_page_content["object_id"] == f"{objnum}-{gennum}"
+        page_dict = first_page_content["content"]
+        assert page_dict["type"] == "dict"
+        assert page_dict["value"]["/Type"]["value"] == "/Page"
 
-        # Test various navigation paths
-        test_paths = [
-            "Pages",
-            "Pages.Count",
-            "Pages.Kids",
-        ]
-
-        for path in test_paths:
-            try:
-                result = parser.parse_pdf_lazy(str(sample_pdf_path), path=path)
-                assert "result" in result
-                # Each path should return some valid object
-                assert isinstance(result["result"], dict)
-            except Exception as e:
-                # Some paths might not exist in test PDF, that's OK
-                pytest.skip(f"Path {path} not available in test PDF: {e}")
+    @pytest.mark.integration
+    @pytest.mark.parametrize("path", ["Pages", "Pages.Count", "Pages.Kids"])
+    def test_path_navigation_comprehensive(self, parser, sample_pdf_stream, path):
+        """Test comprehensive path navigation scenarios."""
+        try:
+            result = parser.parse_pdf_lazy(sample_pdf_stream, path=path)
+        except PDFParsingError as e:
+            # A path genuinely absent from the sample PDF is expected to fail;
+            # anything else (corrupt parse, navigation bug) should surface
+            if isinstance(e.__cause__, InvalidPathError):
+                pytest.xfail(f"Path {path} not available in test PDF: {e}")
+            raise
+
+        assert "result" in result
+        # Each path should return some valid object
+        assert isinstance(result["result"], dict)
 
     @pytest.mark.integration
-    @pytest.mark.asyncio
-    async def test_server_client_workflow(self, server, sample_pdf_path):
+    async def test_server_client_workflow(self, server, sample_pdf_path, pages_ref):
         """Test complete server workflow as if called by MCP client."""
-        if not sample_pdf_path.exists():
-            pytest.skip("Sample PDF not available")
-
-        # Step 1: Get PDF tree (lazy)
+        # Step 1: Get PDF tree (lazy); _return_dict skips the JSON round-trip
         get_args = {"pdf_path": str(sample_pdf_path), "mode": "lazy"}
-        get_result = await server._handle_get_pdf_object_tree(get_args)
+        get_data = await server._handle_get_pdf_object_tree(get_args, _return_dict=True)
 
-        assert len(get_result) == 1
-        get_data = json.loads(get_result[0].text)
         assert "result" in get_data
 
-        # Step 2: Navigate to Pages
-        nav_args = {"pdf_path": str(sample_pdf_path), "path": "Pages", "mode": "lazy"}
-        nav_result = await server._handle_get_pdf_object_tree(nav_args)
-        nav_data = json.loads(nav_result[0].text)
-
-        if nav_data["result"]["type"] == "indirect_ref":
-            pages_objnum = nav_data["result"]["objnum"]
-            pages_gennum = nav_data["result"]["gennum"] or 0
+        # Step 2: Pages reference recovered once per session by the fixture
+        if pages_ref is not None:
+            pages_objnum, pages_gennum = pages_ref
 
             # Step 3: Resolve Pages object
             resolve_args = {
@@ -134,8 +93,9 @@ class TestIntegration:
                 "gennum": pages_gennum,
                 "depth": "shallow",
             }
-            resolve_result = await server._handle_resolve_indirect_object(resolve_args)
-            resolve_data = json.loads(resolve_result[0].text)
+            resolve_data = await server._handle_resolve_indirect_object(
+                resolve_args, _return_dict=True
+            )
 
             assert "object_id" in resolve_data
             assert "content" in resolve_data
@@ -166,7 +126,6 @@ class TestIntegration:
         assert len(full_result["indirect_objects"]) > 0
 
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_error_propagation_through_system(self, server):
         """Test error propagation from parser through server."""
         # Test with nonexistent file
@@ -176,50 +135,12 @@ class TestIntegration:
         try:
             result = await server._handle_get_pdf_object_tree(args)
             # If we get here, check it's an error response
-            response_data = json.loads(result[0].text)
+            response_data = _loads(result[0].text)
             assert "error" in response_data
         except FileNotFoundError:
             # This is also acceptable - the error handling works
             pass
 
-    @pytest.mark.integration
-    @pytest.mark.slow
-    def test_performance_characteristics(self, parser, sample_pdf_path):
-        """Test performance characteristics of lazy vs full parsing."""
-        if not sample_pdf_path.exists():
-            pytest.skip("Sample PDF not available")
-
-        import time
-
-        # Measure lazy parsing time
-        start_time = time.time()
-        lazy_result = parser.parse_pdf_lazy(str(sample_pdf_path))
-        lazy_time = time.time() - start_time
-
-        # Measure full parsing time
-        start_time = time.time()
-        full_result = parser.parse_pdf_full(str(sample_pdf_path))
-        full_time = time.time() - start_time
-
-        # Lazy should be faster (though on small PDFs the difference might be minimal)
-        # This is more of a sanity check than a strict performance test
-        assert lazy_time >= 0  # At least it completed
-        assert full_time >= 0  # At least it completed
-
-        # Check response sizes (lazy should be much smaller)
-        lazy_size = len(json.dumps(lazy_result))
-        full_size = len(json.dumps(full_result))
-
-        # For most PDFs, full result should be significantly larger
-        # But we'll just check they're both valid sizes
-        assert lazy_size > 0
-        assert full_size > 0
-
-        # Usually full_size >> lazy_size, but depends on PDF
-        print(f"Lazy result size: {lazy_size} bytes")
-        print(f"Full result size: {full_size} bytes")
-        print(f"Size ratio: {full_size / lazy_size:.2f}x")
-
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -27,71 +27,66 @@ class TestPDFTypes:
     def test_pdf_name_type(self):
         """Test PDFName type structure."""
         name: PDFName = {"type": "name", "value": "/Pages"}
-        assert name["type"] == "name"
-        assert name["value"] == "/Pages"
+        assert name == {"type": "name", "value": "/Pages"}
 
     def test_pdf_string_type(self):
         """Test PDFString type structure."""
         string: PDFString = {"type": "string", "value": "test", "encoding": "text"}
-        assert string["type"] == "string"
-        assert string["value"] == "test"
-        assert string["encoding"] == "text"
+        assert string == {"type": "string", "value": "test", "encoding": "text"}
 
     def test_pdf_number_type(self):
         """Test PDFNumber type structure."""
         number: PDFNumber = {"type": "number", "value": 42}
-        assert number["type"] == "number"
-        assert number["value"] == 42
+        assert number == {"type": "number", "value": 42}
 
         float_number: PDFNumber = {"type": "number", "value": 3.14}
-        assert float_number["value"] == 3.14
+        assert float_number == {"type": "number", "value": 3.14}
 
     def test_pdf_boolean_type(self):
         """Test PDFBoolean type structure."""
         boolean: PDFBoolean = {"type": "boolean", "value": True}
-        assert boolean["type"] == "boolean"
-        assert boolean["value"] is True
+        assert boolean == {"type": "boolean", "value": True}
 
     def test_pdf_null_type(self):
         """Test PDFNull type structure."""
         null: PDFNull = {"type": "null", "value": None}
-        assert null["type"] == "null"
-        assert null["value"] is None
+        assert null == {"type": "null", "value": None}
 
     def test_pdf_indirect_ref_type(self):
         """Test PDFIndirectRef type structure."""
-        ref: PDFIndirectRef = {"type": "indirect_ref", "id": "1-0"}
-        assert ref["type"] == "indirect_ref"
-        assert ref["id"] == "1-0"
+        ref: PDFIndirectRef = {"type": "indirect_ref", "objnum": 1, "gennum": None}
+        assert ref == {"type": "indirect_ref", "objnum": 1, "gennum": None}
 
     def test_pdf_array_type(self):
         """Test PDFArray type structure."""
-        name_obj: PDFName = {"type": "name", "value": "/Test"}
-        array: PDFArray = {"type": "array", "value": [name_obj]}
-        assert array["type"] == "array"
-        assert len(array["value"]) == 1
-        assert array["value"][0]["type"] == "name"
+        array: PDFArray = {"type": "array", "value": [{"type": "name", "value": "/Test"}]}
+        assert array == {"type": "array", "value": [{"type": "name", "value": "/Test"}]}
 
     def test_pdf_dict_type(self):
         """Test PDFDict type structure."""
-        name_obj: PDFName = {"type": "name", "value": "/Pages"}
-        dict_obj: PDFDict = {"type": "dict", "value": {"/Type": name_obj}}
-        assert dict_obj["type"] == "dict"
-        assert "/Type" in dict_obj["value"]
-        assert dict_obj["value"]["/Type"]["value"] == "/Pages"
+        dict_obj: PDFDict = {
+            "type": "dict",
+            "value": {"/Type": {"type": "name", "value": "/Pages"}},
+        }
+        assert dict_obj == {
+            "type": "dict",
+            "value": {"/Type": {"type": "name", "value": "/Pages"}},
+        }
 
     def test_pdf_stream_type(self):
         """Test PDFStream type structure."""
-        dict_obj: PDFDict = {"type": "dict", "value": {}}
         stream: PDFStream = {
             "type": "stream",
-            "dictionary": dict_obj,
+            "dictionary": {"type": "dict", "value": {}},
+            "has_data": True,
+            "data_length": 1024,
+        }
+        assert stream == {
+            "type": "stream",
+            "dictionary": {"type": "dict", "value": {}},
             "has_data": True,
             "data_length": 1024,
         }
-        assert stream["type"] == "stream"
-        assert stream["has_data"] is True
-        assert stream["data_length"] == 1024
 
     def test_pdf_unknown_type(self):
         """Test PDFUnknown type structure."""
@@ -100,9 +95,11 @@ class TestPDFTypes:
             "python_type": "SomeClass",
             "value": "string representation",
         }
-        assert unknown["type"] == "unknown"
-        assert unknown["python_type"] == "SomeClass"
-        assert unknown["value"] == "string representation"
+        assert unknown == {
+            "type": "unknown",
+            "python_type": "SomeClass",
+            "value": "string representation",
+        }
 
 
 class TestResponseTypes:
@@ -110,38 +107,40 @@ class TestResponseTypes:
 
     def test_lazy_parse_response(self):
         """Test LazyParseResponse type structure."""
-        name_obj: PDFName = {"type": "name", "value": "/Catalog"}
-        response: LazyParseResponse = {"result": name_obj}
-        assert "result" in response
-        assert response["result"]["type"] == "name"
+        response: LazyParseResponse = {"result": {"type": "name", "value": "/Catalog"}}
+        assert response == {"result": {"type": "name", "value": "/Catalog"}}
 
     def test_full_parse_response(self):
         """Test FullParseResponse type structure."""
-        name_obj: PDFName = {"type": "name", "value": "/Catalog"}
-        response: FullParseResponse = {"indirect_objects": {}, "result": name_obj}
-        assert "result" in response
-        assert "indirect_objects" in response
-        assert isinstance(response["indirect_objects"], dict)
+        response: FullParseResponse = {
+            "indirect_objects": {},
+            "result": {"type": "name", "value": "/Catalog"},
+        }
+        assert response == {
+            "indirect_objects": {},
+            "result": {"type": "name", "value": "/Catalog"},
+        }
 
     def test_shallow_resolve_response(self):
         """Test ShallowResolveResponse type structure."""
-        name_obj: PDFName = {"type": "name", "value": "/Pages"}
-        response: ShallowResolveResponse = {"object_id": "1-0", "content": name_obj}
-        assert response["object_id"] == "1-0"
-        assert "content" in response
-        assert response["content"]["type"] == "name"
+        response: ShallowResolveResponse = {
+            "object_id": "1-0",
+            "content": {"type": "name", "value": "/Pages"},
+        }
+        assert response == {"object_id": "1-0", "content": {"type": "name", "value": "/Pages"}}
 
     def test_deep_resolve_response(self):
         """Test DeepResolveResponse type structure."""
-        name_obj: PDFName = {"type": "name", "value": "/Pages"}
         response: DeepResolveResponse = {
             "object_id": "1-0",
-            "content": name_obj,
+            "content": {"type": "name", "value": "/Pages"},
+            "indirect_objects": {},
+        }
+        assert response == {
+            "object_id": "1-0",
+            "content": {"type": "name", "value": "/Pages"},
             "indirect_objects": {},
         }
-        assert response["object_id"] == "1-0"
-        assert "content" in response
-        assert "indirect_objects" in response
 
     def test_resolution_depth_literal(self):
         """Test ResolutionDepth literal type."""
@@ -157,7 +156,7 @@ class TestComplexStructures:
     def test_nested_pdf_structure(self):
         """Test a complex nested PDF structure."""
         # Create a complex structure similar to what parser produces
-        ref: PDFIndirectRef = {"type": "indirect_ref", "id": "3-0"}
+        ref: PDFIndirectRef = {"type": "indirect_ref", "objnum": 3, "gennum": None}
         array: PDFArray = {"type": "array", "value": [ref]}
 
         dict_obj: PDFDict = {
@@ -169,18 +168,23 @@ class TestComplexStructures:
             },
         }
 
-        # Verify structure
-        assert dict_obj["type"] == "dict"
-        assert dict_obj["value"]["/Type"]["value"] == "/Pages"
-        assert dict_obj["value"]["/Count"]["value"] == 2
-        assert dict_obj["value"]["/Kids"]["type"] == "array"
-        assert dict_obj["value"]["/Kids"]["value"][0]["type"] == "indirect_ref"
-        assert dict_obj["value"]["/Kids"]["value"][0]["id"] == "3-0"
+        # One structural equality against the full expected literal
+        assert dict_obj == {
+            "type": "dict",
+            "value": {
+                "/Type": {"type": "name", "value": "/Pages"},
+                "/Count": {"type": "number", "value": 2},
+                "/Kids": {
+                    "type": "array",
+                    "value": [{"type": "indirect_ref", "objnum": 3, "gennum": None}],
+                },
+            },
+        }
 
     def test_response_with_complex_objects(self):
         """Test response containing complex PDF objects."""
         # Create complex objects
-        page_ref: PDFIndirectRef = {"type": "indirect_ref", "id": "2-0"}
+        page_ref: PDFIndirectRef = {"type": "indirect_ref", "objnum": 2, "gennum": None}
         kids_array: PDFArray = {"type": "array", "value": [page_ref]}
 
         pages_dict: PDFDict = {
@@ -195,15 +199,26 @@ class TestComplexStructures:
         # Create full response
         response: FullParseResponse = {
             "indirect_objects": {"3-0": pages_dict},
-            "result": {"type": "indirect_ref", "id": "3-0"},
+            "result": {"type": "indirect_ref", "objnum": 3, "gennum": None},
         }
 
-        # Verify the response structure
-        assert "result" in response
-        assert "indirect_objects" in response
-        assert response["result"]["id"] == "3-0"
-        assert "3-0" in response["indirect_objects"]
-        assert response["indirect_objects"]["3-0"]["type"] == "dict"
+        # One structural equality against the full expected literal
+        assert response == {
+            "indirect_objects": {
+                "3-0": {
+                    "type": "dict",
+                    "value": {
+                        "/Type": {"type": "name", "value": "/Pages"},
+                        "/Kids": {
+                            "type": "array",
+                            "value": [{"type": "indirect_ref", "objnum": 2, "gennum": None}],
+                        },
+                        "/Count": {"type": "number", "value": 1},
+                    },
+                }
+            },
+            "result": {"type": "indirect_ref", "objnum": 3, "gennum": None},
+        }
 
 
 if __name__ == "__main__":